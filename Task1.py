@@ -1,7 +1,43 @@
 
 
 import csv
-import os
+import io
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+
+try:
+    import pandas as pd
+except ImportError:
+
+    pd = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+
+    _filter_kernel = None
+else:
+
+    @njit(cache=True)
+    def _filter_kernel(caps, masks, bldg_ids, min_cap, free_hour, bldg_id):
+        # A filter of -1 means "not set"; returns the matching indices.
+        n = caps.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            out[i] = ((bldg_id < 0 or bldg_ids[i] == bldg_id)
+                      and (min_cap < 0 or caps[i] >= min_cap)
+                      and (free_hour < 0 or ((masks[i] >> free_hour) & 1) == 0))
+        return np.flatnonzero(out)
+
+
+# Matches the hour numbers in a saved booked_hours field like "3;5;17".
+_DIGITS = re.compile(r'\d+')
+
+# Hours are always 0..23, so a dict lookup beats Python's full int parser.
+_HOUR_LUT = {str(i): i for i in range(24)}
 
 
 class RoomNotFoundError(Exception):
@@ -19,27 +55,51 @@ class RoomAlreadyExistsError(Exception):
 
 class Room:
 
+    # Slots drop the per-instance __dict__: less memory per room and
+    # faster attribute reads in the filter loops.
+    __slots__ = ('room_no', 'building', 'capacity', '_building_lc', '_mask', '_booked_str')
+
     def __init__(self, room_no: str, building: str, capacity: int, booked_hours=None):
-        self.room_no = room_no
-        self.building = building
+        # Room and building names repeat across many places (dict keys,
+        # index sets, columns); interning makes those compares pointer checks.
+        self.room_no = sys.intern(room_no)
+        self.building = sys.intern(building)
         self.capacity = int(capacity)
-        self.booked_hours = [] if booked_hours is None else list(map(int, booked_hours))
+
+        # Lowercased once here (and interned so comparisons are pointer
+        # checks) instead of on every building filter.
+        self._building_lc = sys.intern(building.lower())
+
+        # Booked hours are kept as a 24-bit mask: bit h set means hour h is booked.
+        self._mask = 0
+        if booked_hours is not None:
+            for h in booked_hours:
+                self._mask |= 1 << int(h)
+
+        # Rendered booked-hours string, rebuilt only after a booking.
+        self._booked_str = None
+
+    @property
+    def booked_hours(self):
+
+        return [h for h in range(24) if (self._mask >> h) & 1]
 
     def is_free_at(self, hour: int) -> bool:
 
-        return hour not in self.booked_hours
+        return not (self._mask >> hour) & 1
 
     def book_hour(self, hour: int):
-  
-        if not self.is_free_at(hour):
-            raise TimeslotAlreadyBookedError(f"Room {self.room_no} is already booked at hour {hour}")
-        self.booked_hours.append(hour)
 
-        self.booked_hours.sort()
+        if self._mask & (1 << hour):
+            raise TimeslotAlreadyBookedError(f"Room {self.room_no} is already booked at hour {hour}")
+        self._mask |= 1 << hour
+        self._booked_str = None
 
     def booked_hours_str(self) -> str:
 
-        return ";".join(str(h) for h in self.booked_hours)
+        if self._booked_str is None:
+            self._booked_str = ";".join(str(h) for h in range(24) if (self._mask >> h) & 1)
+        return self._booked_str
 
     def __str__(self):
         return f"Room {self.room_no} | Building: {self.building} | Capacity: {self.capacity} | Booked: {self.booked_hours_str()}"
@@ -52,15 +112,59 @@ class BookingSystem:
 
         self.rooms = {}
 
+        # Column layout mirroring self.rooms: filters scan one packed
+        # column at a time instead of chasing Room objects around the heap.
+        self._room_nos = []
+        self._buildings = []
+        self._buildings_lower = []
+        self._capacities = array('i')
+        self._masks = array('i')
+        self._index = {}
+
+        # Buildings encoded as small ints for the numeric filter kernel.
+        self._building_ids = array('i')
+        self._building_id_of = {}
+
+        # Inverted index: lowercased building name -> set of room_nos,
+        # so a building filter is one dict lookup instead of a full scan.
+        self._by_building = {}
+
+        # _free_at[h] is the set of room_nos still free at hour h, kept
+        # current on every booking so the free-hour filter is a lookup too.
+        self._free_at = [set() for _ in range(24)]
+
+        # (capacity, room_no) pairs kept sorted by capacity, so a
+        # min_capacity query is a bisect plus a slice rather than a scan.
+        self._cap_sorted = []
+
         self.load_from_csv()
 
 
+    def _register_room(self, room: Room):
+
+        i = len(self._room_nos)
+        building_lower = room._building_lc
+        self._room_nos.append(room.room_no)
+        self._buildings.append(room.building)
+        self._buildings_lower.append(building_lower)
+        self._capacities.append(room.capacity)
+        self._masks.append(room._mask)
+        self._index[room.room_no] = i
+        self._building_ids.append(
+            self._building_id_of.setdefault(building_lower, len(self._building_id_of)))
+        self._by_building.setdefault(building_lower, set()).add(room.room_no)
+        for h in range(24):
+            if room.is_free_at(h):
+                self._free_at[h].add(room.room_no)
+        insort(self._cap_sorted, (room.capacity, room.room_no))
+
     def add_room(self, room_no: str, building: str, capacity: int):
 
         if room_no in self.rooms:
             raise RoomAlreadyExistsError(f"Room {room_no} already exists.")
         room = Room(room_no, building, capacity)
         self.rooms[room_no] = room
+        self._register_room(room)
 
     def get_room(self, room_no: str) -> Room:
 
@@ -75,63 +179,143 @@ class BookingSystem:
         if hour < 0 or hour > 23:
             raise ValueError("Hour must be between 0 and 23.")
         room.book_hour(hour)
+        self._masks[self._index[room_no]] = room._mask
+        self._free_at[hour].discard(room_no)
 
 
     def find_rooms(self, building=None, min_capacity=None, free_at_hour=None):
 
+        b = sys.intern(building.lower()) if building is not None else None
+        mc = int(min_capacity) if min_capacity is not None else None
+        fh = int(free_at_hour) if free_at_hour is not None else None
 
+        if _filter_kernel is not None and (b, mc, fh) != (None, None, None):
+            if b is not None:
+                bldg_id = self._building_id_of.get(b)
+                if bldg_id is None:
+                    return []
+            else:
+                bldg_id = -1
+            # frombuffer gives zero-copy int32 views over the array('i') columns.
+            idxs = _filter_kernel(np.frombuffer(self._capacities, dtype=np.int32),
+                                  np.frombuffer(self._masks, dtype=np.int32),
+                                  np.frombuffer(self._building_ids, dtype=np.int32),
+                                  mc if mc is not None else -1,
+                                  fh if fh is not None else -1,
+                                  bldg_id)
+            rooms = self.rooms
+            room_nos = self._room_nos
+            return [rooms[room_nos[i]] for i in idxs]
+
+        if b is None and mc is None and fh is None:
+
+            return list(self.rooms.values())
+
+        # Seed the candidates from whichever indices apply; with two set
+        # indices active the intersection is already tiny before any scan.
+        room_set = None
+        if b is not None:
+            room_set = self._by_building.get(b, set())
+        if fh is not None:
+            room_set = self._free_at[fh] if room_set is None else room_set & self._free_at[fh]
+        if room_set is None:
+            # Only min_capacity is set: every entry from the bisect point
+            # up in the capacity index already satisfies the filter.
+            start = bisect_left(self._cap_sorted, (mc,))
+            room_set = {rn for _, rn in self._cap_sorted[start:]}
+            mc = None
+
+        index = self._index
+        candidates = sorted(index[rn] for rn in room_set)
+
+        rooms = self.rooms
+        room_nos = self._room_nos
+        if mc is None:
+            return [rooms[room_nos[i]] for i in candidates]
+        capacities = self._capacities
+        return [rooms[room_nos[i]] for i in candidates if capacities[i] >= mc]
+
+
+    def iter_display_rows(self):
+
+        # Render straight off the packed columns: a sequential scan of
+        # four parallel arrays instead of a pointer-chase per Room object.
+        for room_no, building, capacity, mask in zip(
+                self._room_nos, self._buildings, self._capacities, self._masks):
+            booked = ";".join(str(h) for h in range(24) if (mask >> h) & 1)
+            yield f"Room {room_no} | Building: {building} | Capacity: {capacity} | Booked: {booked}"
+
+    def _load_row(self, room_no, building, capacity, booked_hours_str):
+
+        room_no = room_no.strip()
+        if room_no == "":
 
-        results = list(self.rooms.values())
-        if building is not None:
-            results = [r for r in results if r.building.lower() == building.lower()]
-        if min_capacity is not None:
-            results = [r for r in results if r.capacity >= int(min_capacity)]
-        if free_at_hour is not None:
-            results = [r for r in results if r.is_free_at(int(free_at_hour))]
-        return results
-
+            return
+        # Pull the hour numbers straight out of the field with one regex
+        # pass and OR them into the mask: no split list, no per-token strip.
+        mask = 0
+        for m in _DIGITS.finditer(booked_hours_str):
+            tok = m.group()
+            h = _HOUR_LUT.get(tok)
+            if h is None:
+
+                h = int(tok)
+            mask |= 1 << h
+        room = Room(room_no, building.strip(), capacity.strip())
+        room._mask = mask
+        self.rooms[room_no] = room
+        self._register_room(room)
 
     def load_from_csv(self):
 
-        if not os.path.exists(self.CSV_FILE):
-
-            return
         try:
-            with open(self.CSV_FILE, newline='') as f:
-                reader = csv.DictReader(f)
+            if pd is not None:
+                # pandas' C parser is much faster than csv.DictReader on
+                # big saved files; itertuples avoids per-row Series objects.
+                df = pd.read_csv(self.CSV_FILE, dtype=str, keep_default_na=False)
+                for row in df.itertuples(index=False):
+                    self._load_row(row.room_no, row.building, row.capacity, row.booked_hours)
+            else:
+                # Slurp the file in one read and parse from memory with the
+                # positional reader: no per-row dict like DictReader builds.
+                with open(self.CSV_FILE, newline='') as f:
+                    data = f.read()
+                reader = csv.reader(io.StringIO(data, newline=''))
+                next(reader, None)
                 for row in reader:
-                    room_no = row.get('room_no', '').strip()
-                    building = row.get('building', '').strip()
-                    capacity = row.get('capacity', '0').strip()
-                    booked_hours_str = row.get('booked_hours', '').strip()
-                    if booked_hours_str == "":
-                        booked_hours = []
-                    else:
-
-                        booked_hours = [int(x) for x in booked_hours_str.split(';') if x.strip() != '']
-                    if room_no == "":
+                    if len(row) < 4:
 
                         continue
+                    self._load_row(row[0], row[1], row[2], row[3])
+        except FileNotFoundError:
 
-                    room = Room(room_no, building, capacity, booked_hours)
-                    self.rooms[room_no] = room
+            return
         except Exception as e:
             print("Warning: could not load CSV file. Starting with empty data.")
             print("Error:", e)
 
     def save_to_csv(self):
 
+        fieldnames = ['room_no', 'building', 'capacity', 'booked_hours']
+        if pd is not None:
+            rooms = list(self.rooms.values())
+            df = pd.DataFrame({
+                'room_no': [r.room_no for r in rooms],
+                'building': [r.building for r in rooms],
+                'capacity': [r.capacity for r in rooms],
+                'booked_hours': [r.booked_hours_str() for r in rooms],
+            }, columns=fieldnames)
+            df.to_csv(self.CSV_FILE, index=False)
+            return
+        # Render everything into an in-memory buffer first so the file
+        # gets one big write instead of one per row.
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(fieldnames)
+        writer.writerows((r.room_no, r.building, r.capacity, r.booked_hours_str())
+                         for r in self.rooms.values())
         with open(self.CSV_FILE, 'w', newline='') as f:
-            fieldnames = ['room_no', 'building', 'capacity', 'booked_hours']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for room in self.rooms.values():
-                writer.writerow({
-                    'room_no': room.room_no,
-                    'building': room.building,
-                    'capacity': room.capacity,
-                    'booked_hours': room.booked_hours_str()
-                })
+            f.write(buf.getvalue())
 
 
 
@@ -250,8 +434,7 @@ while True:
             print('No rooms in the system yet.')
         else:
             print('\nAll rooms:')
-            for r in system.rooms.values():
-                print(r)
+            print('\n'.join(system.iter_display_rows()))
 
     elif choice == '6':
 